@@ -1,4 +1,7 @@
 from .assets import AssetsManager
 from .renderer import InventoryRenderer
+from .layouts import ContainerLayout, LayoutRegistry
+from .skins import SkinRenderer
+from .scheduler import RenderScheduler
 
-__all__ = ["AssetsManager", "InventoryRenderer"]
+__all__ = ["AssetsManager", "InventoryRenderer", "ContainerLayout", "LayoutRegistry", "SkinRenderer", "RenderScheduler"]
@@ -46,6 +46,7 @@ class AssetsManager:
         self.versions = ["1.21.10", "1.21.6", "1.21.5", "1.21.4", "1.20.6", "1.19.4", "1.18.2", "1.17.1", "1.16.5", "1.15.2", "1.14.4", "1.13.2"]
         self.index = {}
         self.path_cache = {}
+        self.version_files = {}
         self.local_version = None
         self._ready = False
 
@@ -155,6 +156,8 @@ class AssetsManager:
         if os.path.exists(self.versions_dir):
             shutil.rmtree(self.versions_dir)
         os.makedirs(self.versions_dir, exist_ok=True)
+        self.path_cache = {}
+        self.version_files = {}
 
         async with aiohttp.ClientSession() as session:
             sem = asyncio.Semaphore(4)
@@ -194,17 +197,28 @@ class AssetsManager:
         if cache_key in self.path_cache:
             return self.path_cache[cache_key]
 
+        files = self.version_files.get(version)
+        if files is None:
+            files = self._scan_version(version)
+            if files is None: return None
+
+        path = files.get(f"{clean_name}.png")
+        if path:
+            self.path_cache[cache_key] = path
+        return path
+
+    def _scan_version(self, version):
+        """Maps every filename of a version folder to its path, walking the folder once."""
         v_dir = os.path.join(self.versions_dir, version)
         if not os.path.exists(v_dir): return None
 
         # Recursive search to handle nested folders in ZIPs
-        for root, _, files in os.walk(v_dir):
-            filename = f"{clean_name}.png"
-            if filename in files:
-                path = os.path.join(root, filename)
-                self.path_cache[cache_key] = path
-                return path
-        return None
+        files = {}
+        for root, _, names in os.walk(v_dir):
+            for filename in names:
+                files.setdefault(filename, os.path.join(root, filename))
+        self.version_files[version] = files
+        return files
 
     async def get_icon(self, item_id):
         if not self._ready: await self.initialize()
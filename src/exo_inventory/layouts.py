@@ -0,0 +1,178 @@
+from PIL import Image, ImageDraw
+
+# Vanilla GUI palette (unscaled texture colors)
+PANEL_COLOR = (198, 198, 198, 255)
+SLOT_COLOR = (139, 139, 139, 255)
+SHADOW_COLOR = (55, 55, 55, 255)
+HIGHLIGHT_COLOR = (255, 255, 255, 255)
+SLOT_SIZE = 16
+SLOT_STEP = 18
+
+
+def grid(x, y, cols, rows):
+    """Returns slot positions for a cols x rows grid, row-major, in MC GUI pixels."""
+    return [(x + c * SLOT_STEP, y + r * SLOT_STEP) for r in range(rows) for c in range(cols)]
+
+
+class ContainerLayout:
+    """
+    Declarative description of a container GUI.
+    slots: list of (x, y) unscaled positions, indexed by slot number.
+    empties: optional {slot: 'helmet'} map of placeholder icons for empty slots.
+    background: optional UI asset name; a vanilla-style panel is drawn when missing.
+    """
+
+    def __init__(self, name, width, height, slots, empties=None, background=None, char_box=None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.slots = list(slots)
+        self.empties = empties or {}
+        self.background = background
+        self.char_box = char_box
+
+    def draw_panel(self):
+        """Draws an unscaled vanilla-style panel with a frame around every slot."""
+        panel = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(panel)
+        w, h = self.width - 1, self.height - 1
+        draw.rectangle((1, 1, w - 1, h - 1), fill=PANEL_COLOR)
+        # Outer border + bevel
+        draw.line((2, 0, w - 2, 0), fill=(0, 0, 0, 255))
+        draw.line((2, h, w - 2, h), fill=(0, 0, 0, 255))
+        draw.line((0, 2, 0, h - 2), fill=(0, 0, 0, 255))
+        draw.line((w, 2, w, h - 2), fill=(0, 0, 0, 255))
+        draw.line((2, 1, w - 3, 1), fill=HIGHLIGHT_COLOR)
+        draw.line((1, 2, 1, h - 3), fill=HIGHLIGHT_COLOR)
+        draw.line((3, h - 1, w - 2, h - 1), fill=(85, 85, 85, 255))
+        draw.line((w - 1, 3, w - 1, h - 2), fill=(85, 85, 85, 255))
+
+        for x, y in self.slots:
+            x0, y0, x1, y1 = x - 1, y - 1, x + SLOT_SIZE, y + SLOT_SIZE
+            draw.rectangle((x0, y0, x1, y1), fill=SLOT_COLOR)
+            draw.line((x0, y0, x1 - 1, y0), fill=SHADOW_COLOR)
+            draw.line((x0, y0, x0, y1 - 1), fill=SHADOW_COLOR)
+            draw.line((x0 + 1, y1, x1, y1), fill=HIGHLIGHT_COLOR)
+            draw.line((x1, y0 + 1, x1, y1), fill=HIGHLIGHT_COLOR)
+        return panel
+
+    def compile(self, assets, scale):
+        """Pre-scales background, slot geometry and empty-slot icons once for repeated renders."""
+        panel = None
+        if self.background:
+            gui_img = assets.get_ui_asset(self.background)
+            if gui_img:
+                panel = Image.new("RGBA", (self.width, self.height), PANEL_COLOR)
+                panel.paste(gui_img, (0, 0), gui_img)
+        if panel is None:
+            panel = self.draw_panel()
+
+        background = panel.resize((self.width * scale, self.height * scale), Image.Resampling.NEAREST)
+        size = SLOT_SIZE * scale
+        rects = tuple((x * scale, y * scale, x * scale + size, y * scale + size) for x, y in self.slots)
+
+        empty_icons = {}
+        for slot, empty_type in self.empties.items():
+            icon = assets.get_ui_asset(f"empty_{empty_type}")
+            if icon:
+                empty_icons[slot] = icon.resize((size, size), Image.Resampling.NEAREST)
+        return CompiledLayout(self, background, rects, scale, empty_icons)
+
+
+class CompiledLayout:
+    """Scaled background, slot-index -> pixel-rect geometry and scaled empty-slot icons. Treat as read-only."""
+
+    def __init__(self, layout, background, rects, scale, empty_icons=None):
+        self.layout = layout
+        self.name = layout.name
+        self.background = background
+        self.rects = rects
+        self.empties = layout.empties
+        self.empty_icons = empty_icons or {}
+        self.scale = scale
+        self.char_box = None
+        if layout.char_box:
+            c = layout.char_box
+            self.char_box = {k: c[k] * scale for k in ("x", "y", "w", "h")}
+
+    @property
+    def size(self):
+        return self.background.size
+
+    def new_canvas(self):
+        """Returns a fresh copy of the pre-scaled background to draw on."""
+        return self.background.copy()
+
+
+# Vanilla container slot positions (container section only, no player inventory)
+PRESETS = {
+    "chest_9x3": ContainerLayout("chest_9x3", 176, 79, grid(8, 18, 9, 3)),
+    "chest_9x6": ContainerLayout("chest_9x6", 176, 133, grid(8, 18, 9, 6)),
+    "ender_chest": ContainerLayout("ender_chest", 176, 79, grid(8, 18, 9, 3)),
+    "shulker_box": ContainerLayout("shulker_box", 176, 79, grid(8, 18, 9, 3)),
+    "hopper": ContainerLayout("hopper", 176, 44, grid(44, 20, 5, 1)),
+    "dispenser": ContainerLayout("dispenser", 176, 78, grid(62, 17, 3, 3)),
+    # 0: input, 1: fuel, 2: output
+    "furnace": ContainerLayout("furnace", 176, 78, [(56, 17), (56, 53), (116, 35)]),
+    # 0: result, 1-9: crafting grid
+    "crafting_table": ContainerLayout("crafting_table", 176, 78, [(124, 35)] + grid(30, 17, 3, 3)),
+    # Player slot numbering: 0-8 hotbar, 9-35 main, 36-39 boots..helmet, 40 offhand
+    "player": ContainerLayout(
+        "player", 176, 166,
+        grid(8, 142, 9, 1) + grid(8, 84, 9, 3) + [(8, 62), (8, 44), (8, 26), (8, 8), (77, 62)],
+        empties={36: "boots", 37: "leggings", 38: "chestplate", 39: "helmet", 40: "shield"},
+        background="inventory_bg",
+        char_box={"x": 26, "y": 8, "w": 51, "h": 72}
+    ),
+}
+
+ALIASES = {
+    "chest": "chest_9x3",
+    "large_chest": "chest_9x6",
+    "double_chest": "chest_9x6",
+    "shulker": "shulker_box",
+    "dropper": "dispenser",
+    "blast_furnace": "furnace",
+    "smoker": "furnace",
+    "crafting": "crafting_table",
+}
+
+
+class LayoutRegistry:
+    """Holds container layouts and compiles each one at most once per scale."""
+
+    def __init__(self, assets, scale):
+        self.assets = assets
+        self.scale = scale
+        self.layouts = dict(PRESETS)
+        self.aliases = dict(ALIASES)
+        self._compiled = {}
+
+    def register(self, layout, aliases=()):
+        """Adds or replaces a layout. Any cached compilation for it is discarded."""
+        self.layouts[layout.name] = layout
+        self._compiled.pop(layout.name, None)
+        for alias in aliases:
+            self.aliases[alias] = layout.name
+
+    def __contains__(self, name):
+        return self.aliases.get(name, name) in self.layouts
+
+    def names(self):
+        return list(self.layouts.keys())
+
+    def get(self, name):
+        """Returns the CompiledLayout for a name or alias, compiling it on first use."""
+        if isinstance(name, ContainerLayout):
+            if self.layouts.get(name.name) is not name:
+                self.register(name)
+            name = name.name
+        name = self.aliases.get(name, name)
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            layout = self.layouts.get(name)
+            if layout is None:
+                raise KeyError(f"Unknown layout: {name}")
+            compiled = layout.compile(self.assets, self.scale)
+            self._compiled[name] = compiled
+        return compiled
@@ -1,18 +1,25 @@
 import discord
 from PIL import Image, ImageDraw, ImageFont
 import aiohttp
+import asyncio
 import io
 import os
 from .assets import AssetsManager
+from .layouts import ContainerLayout, LayoutRegistry, grid
 
 # Minecraft Standard Constants
 SCALE = 4
 SLOT_SIZE = 16
 SLOT_STEP = 18
+# mc-heads.net request timeout (seconds)
+BODY_TIMEOUT = 5
 
 class InventoryRenderer:
-    def __init__(self, assets_dir=None):
+    def __init__(self, assets_dir=None, skins=None):
         self.assets = AssetsManager(assets_dir)
+        # Optional SkinRenderer: draws bodies locally instead of using mc-heads.net
+        self.skins = skins
+        self.layouts = LayoutRegistry(self.assets, SCALE)
         self.session = None
         self._initialized = False
         
@@ -45,12 +52,15 @@ class InventoryRenderer:
         """Closes the underlying aiohttp session."""
         if self.session and not self.session.closed:
             await self.session.close()
+        if self.skins:
+            await self.skins.close()
 
-    async def get_player_render(self, uuid, render_type="body", size=400, angle=None):
+    async def get_player_render(self, uuid, render_type="body", size=400, angle=None, timeout=BODY_TIMEOUT):
         """
         Fetches player render from mc-heads.net.
         render_type: 'body', 'head', 'avatar', 'player'
         angle: optional rotation angle for body renders
+        timeout: request timeout in seconds
         """
         url = f"https://mc-heads.net/{render_type}/{uuid}/{size}"
         if angle is not None:
@@ -58,14 +68,14 @@ class InventoryRenderer:
             
         session = await self.get_session()
         try:
-            async with session.get(url, timeout=5) as resp:
+            async with session.get(url, timeout=timeout) as resp:
                 if resp.status == 200:
                     return Image.open(io.BytesIO(await resp.read())).convert("RGBA")
         except Exception: return None
 
-    async def fetch_player_body(self, uuid):
+    async def fetch_player_body(self, uuid, timeout=BODY_TIMEOUT):
         # Legacy support
-        return await self.get_player_render(uuid, "body", 400)
+        return await self.get_player_render(uuid, "body", 400, timeout=timeout)
 
     def _get_font(self):
         try:
@@ -83,17 +93,25 @@ class InventoryRenderer:
 
     async def draw_item(self, img, draw, font, item_id, count, x, y, empty_type=None):
         """Draws an item at specific coordinates."""
-        rx, ry = x * SCALE, y * SCALE
-        
+        await self.draw_item_at(img, draw, font, item_id, count, x * SCALE, y * SCALE, empty_type)
+
+    async def draw_item_at(self, img, draw, font, item_id, count, rx, ry, empty_type=None, icon=None, empty_icon=None):
+        """
+        Draws an item at already scaled pixel coordinates.
+        icon / empty_icon: pre-loaded (empty_icon pre-scaled) images that skip the asset lookup.
+        """
         if not item_id or item_id in ["minecraft:air", "air"]:
-            if empty_type:
+            if empty_icon:
+                img.paste(empty_icon, (rx, ry), empty_icon)
+            elif empty_type:
                 e_icon = self.assets.get_ui_asset(f"empty_{empty_type}")
                 if e_icon:
                     e_rendered = e_icon.resize((SLOT_SIZE * SCALE, SLOT_SIZE * SCALE), Image.Resampling.NEAREST)
                     img.paste(e_rendered, (rx, ry), e_rendered)
             return
 
-        icon = await self.assets.get_icon(item_id)
+        if icon is None:
+            icon = await self.assets.get_icon(item_id)
         if icon:
             target_size = SLOT_SIZE * SCALE
             resample = Image.Resampling.NEAREST if icon.width <= 32 else Image.Resampling.LANCZOS
@@ -108,11 +126,34 @@ class InventoryRenderer:
                 draw.text((tx + 2, ty + 2), txt, fill=(0, 0, 0, 180), font=font)
                 draw.text((tx, ty), txt, fill=(255, 255, 255, 255), font=font)
 
-    async def render_custom(self, items_map, background=None, player_uuid=None, width=176, height=166):
+    async def _draw_body(self, bg, uuid, c, timeout=None):
+        """Draws a player body centered in a scaled char_box. timeout caps the body fetch."""
+        target_h = int(c["h"] * 0.95)
+        if self.skins:
+            # Local skins are rendered straight at the target size
+            body_hd = await self.skins.render_body(uuid, c["w"], target_h, timeout=timeout)
+        else:
+            body = await self.fetch_player_body(uuid, BODY_TIMEOUT if timeout is None else min(timeout, BODY_TIMEOUT))
+            body_hd = None
+            if body:
+                target_w = int(body.width * target_h / body.height)
+                body_hd = body.resize((target_w, target_h), Image.Resampling.LANCZOS)
+        if body_hd:
+            bw, bh = body_hd.size
+            bg.paste(body_hd, (c["x"] + (c["w"] - bw) // 2, c["y"] + (c["h"] - bh) // 2), body_hd)
+
+    def _to_file(self, img, filename="render.png"):
+        output = io.BytesIO()
+        img.save(output, format="PNG")
+        output.seek(0)
+        return discord.File(fp=output, filename=filename)
+
+    async def render_custom(self, items_map, background=None, player_uuid=None, width=176, height=166, body_timeout=None):
         """
         Renders a custom grid or inventory.
         items_map: List of dicts [{'id': 'id', 'count': 1, 'x': 8, 'y': 8, 'empty': 'helmet'}]
         background: Image object, color tuple (R,G,B,A), or None (fully transparent)
+        body_timeout: optional cap (seconds) on the player body fetch
         """
         await self.initialize()
         
@@ -132,16 +173,8 @@ class InventoryRenderer:
 
         # 2. Optional Player Body
         if player_uuid:
-            body = await self.fetch_player_body(player_uuid)
-            if body:
-                c = self.layout["char_box"]
-                target_h = int(c["h"] * SCALE * 0.95)
-                ratio = target_h / body.height
-                target_w = int(body.width * ratio)
-                body_hd = body.resize((target_w, target_h), Image.Resampling.LANCZOS)
-                bx, by = c["x"] * SCALE, c["y"] * SCALE
-                bw, bh = c["w"] * SCALE, c["h"] * SCALE
-                bg.paste(body_hd, (bx + (bw - target_w) // 2, by + (bh - target_h) // 2), body_hd)
+            c = {k: v * SCALE for k, v in self.layout["char_box"].items()}
+            await self._draw_body(bg, player_uuid, c, body_timeout)
 
         # 3. Draw Items
         for item in items_map:
@@ -154,77 +187,136 @@ class InventoryRenderer:
                 item.get('empty')
             )
 
-        output = io.BytesIO()
-        bg.save(output, format="PNG")
-        output.seek(0)
-        return discord.File(fp=output, filename="render.png")
+        return self._to_file(bg)
 
-    async def render_player(self, player_data):
-        """High-level helper for standard MC player data."""
+    async def render_container(self, layout, items, player_uuid=None, body_timeout=None):
+        """
+        Renders items onto a registered container layout.
+        layout: preset name ('chest_9x3', 'chest_9x6', 'ender_chest', 'shulker_box', 'hopper',
+                'dispenser', 'furnace', 'crafting_table', 'player') or a ContainerLayout
+        items: List of dicts [{'id': 'id', 'count': 1, 'slot': 0}] or a {slot: item} dict
+        body_timeout: optional cap (seconds) on the player body fetch
+        """
+        await self.initialize()
+        compiled = self.layouts.get(layout)
+        bg = compiled.new_canvas()
+        draw = ImageDraw.Draw(bg)
+        font = self._get_font()
+
+        if player_uuid and compiled.char_box:
+            await self._draw_body(bg, player_uuid, compiled.char_box, body_timeout)
+
+        if not isinstance(items, dict):
+            items = {i.get('slot'): i for i in items if i}
+
+        for slot, (rx, ry, _, _) in enumerate(compiled.rects):
+            item = items.get(slot)
+            await self.draw_item_at(
+                bg, draw, font,
+                item.get('id') if item else None,
+                item.get('count', 1) if item else 1,
+                rx, ry,
+                compiled.empties.get(slot),
+                empty_icon=compiled.empty_icons.get(slot)
+            )
+
+        return self._to_file(bg)
+
+    async def render_player(self, player_data, with_body=True, body_timeout=None):
+        """
+        High-level helper for standard MC player data.
+        with_body=False skips the body fetch; body_timeout caps it (seconds).
+        """
         await self.initialize()
         
-        # 1. Load background with solid fallback
-        bg_path = os.path.join(self.assets.cache_dir, "inventory_bg.png")
-        # Standard Minecraft GUI size
-        w, h = 176, 166
-        
-        # Base solid color (ignoring transparency by filling the canvas)
-        final_bg = Image.new("RGBA", (w * SCALE, h * SCALE), (198, 198, 198, 255))
-        
-        if os.path.exists(bg_path):
-            try:
-                gui_img = Image.open(bg_path).convert("RGBA")
-                # If it's smaller than 176x166, we paste it at (0,0) on the final_bg
-                # But we must scale it first
-                gh = gui_img.height
-                gw = gui_img.width
-                
-                # We resize the UI image to match our scale
-                # If it's shorter than 166, it will just cover the top part
-                gui_scaled = gui_img.resize((gw * SCALE, gh * SCALE), Image.Resampling.NEAREST)
-                final_bg.paste(gui_scaled, (0, 0), gui_scaled)
-            except Exception: pass
-
-        items = []
-        
-        # Armor
-        armor_map = {39: "helmet", 38: "chestplate", 37: "leggings", 36: "boots"}
-        for slot_id, name in armor_map.items():
-            item = next((a for a in player_data.get('armor', []) if a and a.get('slot') == slot_id), None)
-            x, y = self.layout["armor"][name]
-            items.append({
-                'id': item.get('id') if item else None,
-                'count': item.get('count', 1) if item else 1,
-                'x': x, 'y': y, 'empty': name
-            })
-
-        # Offhand
-        oh = player_data.get('off_hand')
-        ox, oy = self.layout["offhand"]
-        items.append({'id': oh.get('id') if oh else None, 'count': oh.get('count', 1) if oh else 1, 'x': ox, 'y': oy, 'empty': 'shield'})
-
-        # Inventory
-        start_x, start_y = self.layout["inventory_start"]
-        for row in range(3):
-            for col in range(9):
-                slot_id = 9 + row * 9 + col
-                item = next((i for i in player_data.get('main_inventory', []) if i and i.get('slot') == slot_id), None)
-                items.append({
-                    'id': item.get('id') if item else None,
-                    'count': item.get('count', 1) if item else 1,
-                    'x': start_x + col * SLOT_STEP,
-                    'y': start_y + row * SLOT_STEP
-                })
-
-        # Hotbar
-        sx, sy = self.layout["hotbar_start"]
-        for col in range(9):
-            item = next((i for i in player_data.get('hotbar', []) if i and i.get('slot') == col), None)
-            items.append({
-                'id': item.get('id') if item else None,
-                'count': item.get('count', 1) if item else 1,
-                'x': sx + col * SLOT_STEP,
-                'y': sy
-            })
-
-        return await self.render_custom(items, background=final_bg, player_uuid=player_data['uuid'])
+        # Player slot numbering: 0-8 hotbar, 9-35 main, 36-39 armor, 40 offhand
+        items = {}
+        for key in ('hotbar', 'main_inventory', 'armor'):
+            for item in player_data.get(key, []):
+                if item and item.get('slot') is not None:
+                    items[item['slot']] = item
+        if player_data.get('off_hand'):
+            items[40] = player_data['off_hand']
+
+        player_uuid = player_data['uuid'] if with_body else None
+        return await self.render_container("player", items, player_uuid=player_uuid, body_timeout=body_timeout)
+
+    async def catalogue_items(self, items=None, version=None, prefix=None):
+        """
+        Returns the item names a catalogue would contain, in page order.
+        Unknown items, duplicates and items without a local icon are left out.
+        items: custom list of item ids (defaults to the whole AssetsManager index, sorted)
+        version: only items whose icon comes from this version
+        prefix: only items whose name starts with this prefix
+        """
+        await self.initialize()
+        index = self.assets.index
+        if items is not None:
+            names = list(dict.fromkeys(i.split(":")[-1].lower() for i in items))
+            names = [n for n in names if n in index]
+        else:
+            names = sorted(index.keys())
+        if version:
+            names = [n for n in names if index.get(n) == version]
+        if prefix:
+            prefix = prefix.split(":")[-1].lower()
+            names = [n for n in names if n.startswith(prefix)]
+        return [n for n in names if await self.assets.resolve_path(n)]
+
+    async def _prefetch_icons(self, names):
+        """Resolves, decodes and pre-scales a page of icons in a worker thread."""
+        paths = [await self.assets.resolve_path(n) for n in names]
+        target_size = SLOT_SIZE * SCALE
+
+        def load():
+            icons = {}
+            for name, path in zip(names, paths):
+                if path:
+                    try:
+                        icon = Image.open(path).convert("RGBA")
+                    except Exception:
+                        continue
+                    resample = Image.Resampling.NEAREST if icon.width <= 32 else Image.Resampling.LANCZOS
+                    icons[name] = icon.resize((target_size, target_size), resample)
+            return icons
+
+        return await asyncio.to_thread(load)
+
+    async def iter_catalogue(self, items=None, version=None, prefix=None, columns=9, rows=6, background=True):
+        """
+        Streams the catalogue as paginated grid sheets, one discord.File per page.
+        Each page is encoded before the next is drawn, while the next page's icons load ahead.
+        background: True for the vanilla slot panel, False for a transparent sheet
+        """
+        names = await self.catalogue_items(items, version, prefix)
+        per_page = columns * rows
+        pages = [names[i:i + per_page] for i in range(0, len(names), per_page)]
+        if not pages:
+            return
+
+        sheet = f"catalogue_{columns}x{rows}"
+        if sheet not in self.layouts:
+            self.layouts.register(ContainerLayout(sheet, 14 + columns * SLOT_STEP, 14 + rows * SLOT_STEP, grid(8, 8, columns, rows)))
+        compiled = self.layouts.get(sheet)
+        font = self._get_font()
+
+        pending = asyncio.ensure_future(self._prefetch_icons(pages[0]))
+        try:
+            for page_no, page in enumerate(pages):
+                icons = await pending
+                if page_no + 1 < len(pages):
+                    pending = asyncio.ensure_future(self._prefetch_icons(pages[page_no + 1]))
+
+                if background:
+                    img = compiled.new_canvas()
+                else:
+                    img = Image.new("RGBA", compiled.size, (0, 0, 0, 0))
+                draw = ImageDraw.Draw(img)
+                # Icons that fail to decode are skipped rather than left as holes
+                drawn = [name for name in page if name in icons]
+                for name, (rx, ry, _, _) in zip(drawn, compiled.rects):
+                    await self.draw_item_at(img, draw, font, name, 1, rx, ry, icon=icons[name])
+
+                yield await asyncio.to_thread(self._to_file, img, f"catalogue_{page_no + 1:03d}.png")
+        finally:
+            pending.cancel()
@@ -0,0 +1,213 @@
+import discord
+import asyncio
+import collections
+import hashlib
+import heapq
+import io
+import itertools
+import json
+import time
+
+
+class _RenderJob:
+    def __init__(self, key, method, kwargs, priority, deadline):
+        self.key = key
+        self.method = method
+        self.kwargs = kwargs
+        self.priority = priority
+        self.deadline = deadline
+        self.enqueued = time.monotonic()
+        self.future = asyncio.get_running_loop().create_future()
+        self.started = False
+
+
+class RenderScheduler:
+    """
+    Deadline-aware front end for InventoryRenderer.
+    - priority: lower values are rendered first (FIFO within the same priority)
+    - timeout / deadline: seconds from now / absolute time.monotonic(); requests with
+      less than min_render_time left are not rendered and the caller gets None
+    - identical requests already queued or rendering share a single render
+    - the player body fetch may use the time left minus min_render_time; when that is
+      below body_budget seconds, the body is skipped
+    """
+
+    def __init__(self, renderer, concurrency=4, body_budget=0.25, min_render_time=0.15, metrics_window=1024):
+        self.renderer = renderer
+        self.concurrency = concurrency
+        self.body_budget = body_budget
+        self.min_render_time = min_render_time
+        self._heap = []
+        self._seq = itertools.count()
+        self._jobs = {}
+        self._pending = None
+        self._workers = []
+
+        self._waits = collections.deque(maxlen=metrics_window)
+        self._queued = 0
+        self._running = 0
+        # Caller counters: rejected, expired, merged. Job counters: completed, dropped, degraded, failed.
+        self.counters = {
+            "rejected": 0, "expired": 0, "merged": 0,
+            "completed": 0, "dropped": 0, "degraded": 0, "failed": 0
+        }
+
+    def _ensure_workers(self):
+        if self._pending is None:
+            self._pending = asyncio.Semaphore(0)
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.concurrency:
+            self._workers.append(asyncio.ensure_future(self._worker()))
+
+    async def close(self):
+        """Stops the workers. Queued requests resolve to None."""
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._pending = None
+        for job in self._jobs.values():
+            if not job.future.done():
+                job.future.set_result(None)
+        self._jobs.clear()
+        self._heap.clear()
+        self._queued = 0
+
+    @staticmethod
+    def _make_key(method, kwargs):
+        raw = json.dumps([method, kwargs], sort_keys=True, default=repr)
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def _push(self, job):
+        heapq.heappush(self._heap, (job.priority, next(self._seq), job))
+        self._pending.release()
+
+    async def submit(self, method, kwargs, priority=0, timeout=None, deadline=None, key=None):
+        """
+        Queues renderer.<method>(**kwargs) and waits for the result.
+        Returns a discord.File, or None if the request went stale.
+        """
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        if deadline is not None and deadline - time.monotonic() < self.min_render_time:
+            self.counters["rejected"] += 1
+            return None
+
+        self._ensure_workers()
+        key = key or self._make_key(method, kwargs)
+        job = self._jobs.get(key)
+        if job is not None:
+            self.counters["merged"] += 1
+            # The shared render lives as long as its most patient caller
+            if job.deadline is not None:
+                job.deadline = None if deadline is None else max(job.deadline, deadline)
+            if priority < job.priority and not job.started:
+                job.priority = priority
+                self._push(job)
+        else:
+            job = _RenderJob(key, method, kwargs, priority, deadline)
+            self._jobs[key] = job
+            self._queued += 1
+            self._push(job)
+
+        remaining = None if deadline is None else max(0, deadline - time.monotonic())
+        try:
+            data = await asyncio.wait_for(asyncio.shield(job.future), remaining)
+        except asyncio.TimeoutError:
+            self.counters["expired"] += 1
+            return None
+        if data is None:
+            return None
+        # Every caller gets its own file object over the shared PNG bytes
+        return discord.File(fp=io.BytesIO(data), filename="render.png")
+
+    async def render_player(self, player_data, priority=0, timeout=None, deadline=None):
+        return await self.submit("render_player", {"player_data": player_data}, priority, timeout, deadline)
+
+    async def render_custom(self, items_map, background=None, player_uuid=None, width=176, height=166,
+                            priority=0, timeout=None, deadline=None):
+        kwargs = {"items_map": items_map, "background": background, "player_uuid": player_uuid, "width": width, "height": height}
+        return await self.submit("render_custom", kwargs, priority, timeout, deadline)
+
+    async def render_container(self, layout, items, player_uuid=None, priority=0, timeout=None, deadline=None):
+        kwargs = {"layout": layout, "items": items, "player_uuid": player_uuid}
+        return await self.submit("render_container", kwargs, priority, timeout, deadline)
+
+    async def _render(self, job, body_timeout):
+        kwargs = dict(job.kwargs)
+        with_body = body_timeout is None or body_timeout >= self.body_budget
+        if with_body:
+            kwargs["body_timeout"] = body_timeout
+        else:
+            if job.method == "render_player":
+                kwargs["with_body"] = False
+                self.counters["degraded"] += 1
+            elif kwargs.get("player_uuid"):
+                kwargs["player_uuid"] = None
+                self.counters["degraded"] += 1
+        render = await getattr(self.renderer, job.method)(**kwargs)
+        return render.fp.read()
+
+    async def _worker(self):
+        while True:
+            await self._pending.acquire()
+            _, _, job = heapq.heappop(self._heap)
+            # Leftover entry of a job that was re-queued with a higher priority
+            if job.started:
+                continue
+            job.started = True
+            self._queued -= 1
+
+            now = time.monotonic()
+            self._waits.append(now - job.enqueued)
+            if job.deadline is not None and job.deadline - now < self.min_render_time:
+                self.counters["dropped"] += 1
+                self._finish(job, None)
+                continue
+
+            # Keep min_render_time for drawing once the body is in
+            body_timeout = None if job.deadline is None else job.deadline - now - self.min_render_time
+            self._running += 1
+            try:
+                data = await self._render(job, body_timeout)
+            except asyncio.CancelledError:
+                self._finish(job, None)
+                raise
+            except Exception as e:
+                self.counters["failed"] += 1
+                self._finish(job, error=e)
+            else:
+                self.counters["completed"] += 1
+                self._finish(job, data)
+            finally:
+                self._running -= 1
+
+    def _finish(self, job, result=None, error=None):
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if job.future.done():
+            return
+        if error is not None:
+            job.future.set_exception(error)
+            # Retrieved here so callers that already gave up don't trigger warnings
+            job.future.exception()
+        else:
+            job.future.set_result(result)
+
+    def stats(self):
+        """
+        Queue depth, in-flight renders, counters and queue wait times (seconds).
+        Per caller: rejected (stale on submit), expired (gave up waiting), merged (joined a render).
+        Per job: completed, dropped (went stale in the queue), degraded (body skipped up front), failed.
+        A caller that expires while its job is queued also shows up as a dropped job later.
+        """
+        waits = sorted(self._waits)
+        n = len(waits)
+        return {
+            "queued": self._queued,
+            "in_flight": self._running,
+            **self.counters,
+            "wait_avg": sum(waits) / n if n else 0.0,
+            "wait_p95": waits[min(n - 1, int(n * 0.95))] if n else 0.0,
+            "wait_max": waits[-1] if n else 0.0,
+        }
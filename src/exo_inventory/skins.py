@@ -0,0 +1,207 @@
+from PIL import Image
+import aiohttp
+import asyncio
+import io
+import os
+import re
+import time
+
+# Front faces on a 64x64 skin: (base box, overlay box), in skin pixels
+HEAD = ((8, 8, 16, 16), (40, 8, 48, 16))
+TORSO = ((20, 20, 28, 32), (20, 36, 28, 48))
+RIGHT_ARM = ((44, 20, 48, 32), (44, 36, 48, 48))
+LEFT_ARM = ((36, 52, 40, 64), (52, 52, 56, 64))
+RIGHT_LEG = ((4, 20, 8, 32), (4, 36, 8, 48))
+LEFT_LEG = ((20, 52, 24, 64), (4, 52, 8, 64))
+
+# Dashless UUIDs or Java player names; anything else never reaches the resolver or disk
+PLAYER_ID = re.compile(r"[0-9a-f]{32}|[a-z0-9_]{3,16}")
+
+# Front-facing figure canvas (unscaled)
+FIGURE_W = 16
+FIGURE_H = 32
+
+
+class SkinRenderer:
+    """
+    Composes flat front-facing player bodies and heads from 64x64 skin PNGs.
+    Skins are read from cache_dir/skins or fetched once through resolver.
+    resolver: async callable(uuid) -> PNG bytes or None (defaults to mc-heads.net)
+    miss_ttl: seconds a failed lookup is remembered before the resolver is asked again
+    """
+
+    def __init__(self, cache_dir=None, resolver=None, max_cached=512, miss_ttl=300):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(__file__), "data")
+
+        self.skin_url = "https://mc-heads.net/skin"
+        self.skins_dir = os.path.join(cache_dir, "skins")
+        self.resolver = resolver or self.fetch_skin
+        self.max_cached = max_cached
+        self.session = None
+        self.figure_cache = {}
+        self.miss_ttl = miss_ttl
+        self.misses = {}
+        self._inflight = {}
+
+        try:
+            os.makedirs(self.skins_dir, exist_ok=True)
+        except Exception:
+            # Might be in a read-only environment like site-packages
+            pass
+
+    async def get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    async def close(self):
+        """Closes the underlying aiohttp session."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+    async def fetch_skin(self, uuid):
+        """Default resolver: downloads the raw skin PNG from mc-heads.net."""
+        session = await self.get_session()
+        try:
+            async with session.get(f"{self.skin_url}/{uuid}", timeout=5) as resp:
+                if resp.status == 200:
+                    return await resp.read()
+        except Exception: return None
+
+    @staticmethod
+    def normalize_id(uuid):
+        """Returns the lowercase dashless id, or None if it is not a UUID or player name."""
+        if not isinstance(uuid, str):
+            return None
+        key = uuid.replace("-", "").lower()
+        return key if PLAYER_ID.fullmatch(key) else None
+
+    def skin_path(self, uuid):
+        key = self.normalize_id(uuid)
+        if key is None:
+            return None
+        return os.path.join(self.skins_dir, f"{key}.png")
+
+    async def get_skin(self, uuid, timeout=None):
+        """
+        Returns the skin as RGBA, from disk when cached, otherwise via the resolver.
+        Concurrent lookups for one player share a single fetch; misses are remembered for miss_ttl.
+        timeout: stop waiting after this many seconds; the fetch keeps running and fills the cache
+        """
+        key = self.normalize_id(uuid)
+        if key is None:
+            return None
+        expiry = self.misses.get(key)
+        if expiry is not None:
+            if expiry > time.monotonic():
+                return None
+            del self.misses[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_skin(uuid, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _load_skin(self, uuid, key):
+        path = self.skin_path(key)
+        if os.path.exists(path):
+            try:
+                return Image.open(path).convert("RGBA")
+            except Exception:
+                pass
+
+        try:
+            data = await self.resolver(uuid)
+            skin = Image.open(io.BytesIO(data)).convert("RGBA") if data else None
+        except Exception:
+            skin = None
+        if skin is None:
+            self.misses[key] = time.monotonic() + self.miss_ttl
+            return None
+        try:
+            with open(path, "wb") as f:
+                f.write(data)
+        except Exception:
+            pass
+        return skin
+
+    @staticmethod
+    def is_slim(skin):
+        """
+        Alex-style arms are 3px wide, so the right arm's faces end at x=54:
+        the last two columns of its strip (x=54..55, y=20..32) stay fully transparent.
+        """
+        if skin.height < 64:
+            return False
+        return skin.crop((54, 20, 56, 32)).getextrema()[3][1] == 0
+
+    def compose(self, skin, slim=None):
+        """Builds the unscaled 16x32 front view, overlay layers included."""
+        if slim is None:
+            slim = self.is_slim(skin)
+        legacy = skin.height < 64
+        arm_w = 3 if slim else 4
+
+        figure = Image.new("RGBA", (FIGURE_W, FIGURE_H), (0, 0, 0, 0))
+
+        def layer(box, pos, width=None, mirror=False):
+            x0, y0, x1, y1 = box
+            face = skin.crop((x0, y0, x0 + width if width else x1, y1))
+            if mirror:
+                face = face.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+            figure.alpha_composite(face, pos)
+
+        limbs = [(TORSO, (4, 8), None), (RIGHT_ARM, (4 - arm_w, 8), arm_w), (RIGHT_LEG, (4, 20), None)]
+        if not legacy:
+            limbs += [(LEFT_ARM, (12, 8), arm_w), (LEFT_LEG, (8, 20), None)]
+
+        layer(HEAD[0], (4, 0))
+        for (base, _), pos, width in limbs:
+            layer(base, pos, width)
+
+        if legacy:
+            # Pre-1.8 skins: left limbs mirror the right ones and only the hat overlay exists
+            layer(RIGHT_ARM[0], (12, 8), arm_w, mirror=True)
+            layer(RIGHT_LEG[0], (8, 20), mirror=True)
+            # The game ignores fully opaque legacy hats
+            if skin.crop(HEAD[1]).getextrema()[3][0] < 255:
+                layer(HEAD[1], (4, 0))
+        else:
+            for (_, overlay), pos, width in limbs:
+                layer(overlay, pos, width)
+            layer(HEAD[1], (4, 0))
+        return figure
+
+    async def get_figure(self, uuid, slim=None, timeout=None):
+        key = (self.normalize_id(uuid), slim)
+        figure = self.figure_cache.get(key)
+        if figure is None:
+            skin = await self.get_skin(uuid, timeout)
+            if skin is None:
+                return None
+            figure = self.compose(skin, slim)
+            if len(self.figure_cache) >= self.max_cached:
+                self.figure_cache.pop(next(iter(self.figure_cache)))
+            self.figure_cache[key] = figure
+        return figure
+
+    async def render_body(self, uuid, width, height, slim=None, timeout=None):
+        """Renders the body at the largest integer scale that fits width x height."""
+        figure = await self.get_figure(uuid, slim, timeout)
+        if figure is None:
+            return None
+        scale = max(1, min(width // FIGURE_W, height // FIGURE_H))
+        return figure.resize((FIGURE_W * scale, FIGURE_H * scale), Image.Resampling.NEAREST)
+
+    async def render_head(self, uuid, size=64):
+        """Renders the front of the head (hat overlay included) as a size x size square."""
+        figure = await self.get_figure(uuid)
+        if figure is None:
+            return None
+        return figure.crop((4, 0, 12, 8)).resize((size, size), Image.Resampling.NEAREST)
@@ -1,7 +1,8 @@
 import asyncio
 import os
 import shutil
-from exo_inventory import AssetsManager, InventoryRenderer
+from PIL import Image, ImageChops
+from exo_inventory import AssetsManager, InventoryRenderer, SkinRenderer, RenderScheduler
 
 # Color constants for console
 GREEN = "\033[92m"
@@ -73,6 +74,44 @@ async def test_all():
         f.write(render_custom.fp.read())
     print("✅ Custom grid rendered to: test_custom_grid.png")
 
+    # 3b. Container Presets
+    print(f"\n{GREEN}3b. Testing Container Presets...{RESET}")
+    expected_sizes = {
+        "chest_9x3": (704, 316), "chest_9x6": (704, 532), "ender_chest": (704, 316),
+        "shulker_box": (704, 316), "hopper": (704, 176), "dispenser": (704, 312),
+        "furnace": (704, 312), "crafting_table": (704, 312), "player": (704, 664)
+    }
+    for layout, size in expected_sizes.items():
+        render_layout = await renderer.render_container(
+            layout,
+            [{"id": "diamond", "slot": 0, "count": 3}, {"id": "coal", "slot": 2}]
+        )
+        img = Image.open(render_layout.fp)
+        assert img.size == size, f"{layout}: {img.size} != {size}"
+        img.save(f"test_{layout}.png")
+
+    # An item placed at a slot only changes pixels inside that slot's rect
+    compiled = renderer.layouts.get("chest_9x6")
+    empty = Image.open((await renderer.render_container("chest_9x6", [])).fp).convert("RGBA")
+    for slot in [0, 13, 53]:
+        placed = Image.open((await renderer.render_container("chest_9x6", [{"id": "diamond", "slot": slot}])).fp).convert("RGBA")
+        x0, y0, x1, y1 = ImageChops.difference(empty, placed).getbbox()
+        rx0, ry0, rx1, ry1 = compiled.rects[slot]
+        assert rx0 <= x0 and ry0 <= y0 and x1 <= rx1 and y1 <= ry1, f"slot {slot} drawn outside its rect"
+    print("✅ Container presets rendered to: test_<layout>.png")
+
+    # 3c. Streaming Catalogue
+    print(f"\n{GREEN}3c. Testing Streaming Catalogue...{RESET}")
+    pages = 0
+    async for page in renderer.iter_catalogue(prefix="diamond", columns=5, rows=2):
+        pages += 1
+        with open(f"test_catalogue_{pages}.png", "wb") as f:
+            f.write(page.fp.read())
+    # Unknown names and duplicates never produce pages or empty cells
+    assert await renderer.catalogue_items(items=["diamond", "minecraft:diamond", "nope"]) == ["diamond"]
+    assert [p async for p in renderer.iter_catalogue(items=["nope"])] == []
+    print(f"✅ Catalogue streamed {pages} page(s) to: test_catalogue_<n>.png")
+
     # 4. Advanced Player Rendering (Poses)
     print(f"\n{GREEN}4. Testing 3D Player Poses...{RESET}")
     body_45 = await renderer.get_player_render(player_data["uuid"], render_type="body", angle=45)
@@ -85,6 +124,40 @@ async def test_all():
         head.save("test_player_head.png")
         print("✅ Player head (128px) saved to: test_player_head.png")
 
+    # 4b. Local Skin Rendering
+    print(f"\n{GREEN}4b. Testing Local Skin Rendering...{RESET}")
+    skins = SkinRenderer(assets_dir)
+    local_renderer = InventoryRenderer(assets_dir, skins=skins)
+    render_local = await local_renderer.render_player(player_data)
+    with open("test_player_local_skin.png", "wb") as f:
+        f.write(render_local.fp.read())
+    await local_renderer.close()
+    print("✅ Local skin inventory rendered to: test_player_local_skin.png")
+
+    # Synthetic Alex skin: 3px arms leave the tail of each arm strip empty
+    alex = Image.new("RGBA", (64, 64), (120, 80, 60, 255))
+    for box in [(50, 16, 52, 20), (54, 16, 56, 32), (42, 48, 44, 52), (46, 48, 48, 64)]:
+        alex.paste((0, 0, 0, 0), box)
+    classic = Image.new("RGBA", (64, 64), (120, 80, 60, 255))
+    assert SkinRenderer.is_slim(alex) and not SkinRenderer.is_slim(classic)
+    figure = skins.compose(alex)
+    # Arms sit flush against the torso: x=1..3 and x=12..14, outer columns stay empty
+    assert figure.getpixel((0, 8))[3] == 0 and figure.getpixel((15, 8))[3] == 0
+    assert figure.getpixel((1, 8))[3] == 255 and figure.getpixel((14, 8))[3] == 255
+    print("✅ Slim (Alex) skin detected and composed with 3px arms")
+
+    # 4c. Render Scheduler
+    print(f"\n{GREEN}4c. Testing Render Scheduler...{RESET}")
+    scheduler = RenderScheduler(renderer, concurrency=2)
+    results = await asyncio.gather(
+        scheduler.render_player(player_data, priority=1, timeout=30),
+        scheduler.render_player(player_data, priority=0, timeout=30),
+        scheduler.render_player(player_data, timeout=0)
+    )
+    assert results[0] and results[1] and results[2] is None
+    print(f"✅ Scheduler stats: {scheduler.stats()}")
+    await scheduler.close()
+
     # 5. Asset Exporting
     print(f"\n{GREEN}5. Testing Asset Export System...{RESET}")
     items_to_export = ["diamond_sword", "ender_pearl", "golden_apple"]